@@ -8,22 +8,34 @@ Gas 소비: ~47,000 gas (기본 호출)
 지연: 주문 및 vault 전송은 몇 초간 지연됨
 
 Requirements:
-    pip install web3 eth-abi python-dotenv
+    Python 3.10+
+    pip install web3 eth-abi numpy python-dotenv
 """
 
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
 from enum import IntEnum
+from functools import lru_cache
 import struct
 
+import numpy as np
+import requests
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
 from web3 import Web3
-from eth_abi import encode
+from web3.types import TxReceipt
+from eth_abi import decode
+from eth_abi.exceptions import DecodingError
+from eth_abi.registry import registry
 
 # ============================================
 # Constants
 # ============================================
 
 RPC_URL = "https://rpc.hyperliquid.xyz/evm"
+RPC_TIMEOUT = 10  # seconds
 CORE_WRITER_ADDRESS = "0x3333333333333333333333333333333333333333"
 
 CORE_WRITER_ABI = [
@@ -80,12 +92,123 @@ class BorrowLendOp(IntEnum):
 # Action encoding version
 VERSION = 0x01
 
+# 버전(1 byte) + action ID(3 bytes) 헤더 = big-endian uint32 하나
+_HEADER = struct.Struct(">I")
+
+# action 별 헤더는 import 시점에 미리 계산
+_HEADERS: Dict[ActionId, bytes] = {
+    aid: _HEADER.pack((VERSION << 24) | aid) for aid in ActionId
+}
+
+# ABI 타입 → struct 포맷 (32-byte word, big-endian, 왼쪽 0 패딩)
+_ABI_WORD = {
+    "uint8": "31xB",
+    "bool": "31x?",
+    "uint32": "28xI",
+    "uint64": "24xQ",
+    "uint128": "16x16s",  # 16 bytes big-endian으로 전달
+    "address": "12x20s",  # 20 raw bytes로 전달
+}
+
+
+def _action_packer(*types: str) -> struct.Struct:
+    """
+    header(4s) + ABI 타입 목록으로 고정 길이 action 인코더 생성 (import 시 1회)
+
+    pack() 한 번으로 action 전체를 만들어 중간 bytes 객체/연결 복사가 없음
+    """
+    return struct.Struct(">4s" + "".join(_ABI_WORD[t] for t in types))
+
+
+_LIMIT_ORDER = _action_packer("uint32", "bool", "uint64", "uint64", "bool", "uint8", "uint128")
+_VAULT_TRANSFER = _action_packer("address", "bool", "uint64")
+_TOKEN_DELEGATE = _action_packer("address", "uint64", "bool")
+_STAKING = _action_packer("uint64")
+_SPOT_SEND = _action_packer("address", "uint64", "uint64")
+_USD_CLASS_TRANSFER = _action_packer("uint64", "bool")
+_FINALIZE_EVM_CONTRACT = _action_packer("uint64", "uint8", "uint64")
+_CANCEL_ORDER_BY_OID = _action_packer("uint32", "uint64")
+_CANCEL_ORDER_BY_CLOID = _action_packer("uint32", "uint128")
+_APPROVE_BUILDER_FEE = _action_packer("uint64", "address")
+_SEND_ASSET = _action_packer("address", "address", "uint32", "uint32", "uint64", "uint64")
+_REFLECT_EVM_SUPPLY = _action_packer("uint64", "uint64", "bool")
+_BORROW_LEND_OP = _action_packer("uint8", "uint64", "uint64")
+
+# 동적 타입(string)이 있는 action은 eth_abi 인코더를 한 번만 조회해 재사용
+_ADD_API_WALLET_ENCODER = registry.get_tuple_encoder("address", "string")
+
+# Limit Order action 전체 길이 (header 4 + 7 words = 228 bytes)
+LIMIT_ORDER_SIZE = _LIMIT_ORDER.size
+
+# decode_actions_bulk 결과 (action 당 한 행)
+ACTION_HEADER_DTYPE = np.dtype([("version", "u1"), ("action_id", "u4")])
+
+# Limit Order action 한 개(228 bytes)를 그대로 해석하는 구조 dtype (word k = 4 + 32*k)
+LIMIT_ORDER_DTYPE = np.dtype({
+    "names": [
+        "header", "asset", "is_buy", "limit_px", "sz",
+        "reduce_only", "encoded_tif", "cloid_hi", "cloid_lo",
+    ],
+    "formats": [">u4", ">u4", "?", ">u8", ">u8", "?", "u1", ">u8", ">u8"],
+    "offsets": [
+        0, 4 + 28, 4 + 32 + 31, 4 + 64 + 24, 4 + 96 + 24,
+        4 + 128 + 31, 4 + 160 + 31, 4 + 192 + 16, 4 + 192 + 24,
+    ],
+    "itemsize": LIMIT_ORDER_SIZE,
+})
+
+
+def _address_bytes(addr: str) -> bytes:
+    """주소 → 20 bytes (체크섬 검증 없이 길이만 확인)"""
+    raw = bytes.fromhex(addr[2:] if addr.startswith(("0x", "0X")) else addr)
+    if len(raw) != 20:
+        raise ValueError(f"Invalid address: {addr}")
+    return raw
+
+
+def _column(values: np.ndarray, n: int, name: str) -> np.ndarray:
+    """컬럼 → ndarray, shape이 (n,)이 아니면 ValueError (길이 1 컬럼이 조용히 broadcast 되는 것 방지)"""
+    array = np.asarray(values)
+    if array.shape != (n,):
+        raise ValueError(f"{name}: shape {array.shape} does not match asset ({n},)")
+    return array
+
+
+def _checked_uint(values: np.ndarray, dtype: str, name: str) -> np.ndarray:
+    """
+    정수 컬럼을 범위 검사 후 unsigned dtype으로 변환 (벡터 min/max 검사)
+
+    numpy 캐스팅은 범위를 벗어난 값을 조용히 wrap 하므로 (예: -5 → 2**64 - 5) 변환 전에 검사
+    """
+    array = np.asarray(values)
+    target = np.dtype(dtype)
+    if array.dtype.kind not in "biu":
+        raise ValueError(f"{name}: integer column required, got dtype {array.dtype}")
+    if array.size and (int(array.min()) < 0 or int(array.max()) > np.iinfo(target).max):
+        raise ValueError(
+            f"{name}: values out of range for {target} "
+            f"(min={int(array.min())}, max={int(array.max())})"
+        )
+    return np.ascontiguousarray(array, dtype=target)
+
+
+def _be_columns(values: np.ndarray, dtype: str, name: str) -> np.ndarray:
+    """정수 컬럼 → big-endian byte 행렬 (N, itemsize), 범위를 벗어나면 ValueError"""
+    column = _checked_uint(values, dtype, name)
+    return column.view(np.uint8).reshape(len(column), column.itemsize)
+
+
+@lru_cache(maxsize=8)
+def _load_account(private_key: str) -> LocalAccount:
+    """private key → LocalAccount (secp256k1 주소 유도는 키당 한 번만)"""
+    return Account.from_key(private_key)
+
 
 # ============================================
 # Data Classes
 # ============================================
 
-@dataclass
+@dataclass(slots=True)
 class LimitOrderParams:
     asset: int  # uint32
     is_buy: bool
@@ -96,70 +219,70 @@ class LimitOrderParams:
     cloid: int  # uint128 - client order ID (0 if none)
 
 
-@dataclass
+@dataclass(slots=True)
 class VaultTransferParams:
     vault: str  # address
     is_deposit: bool
     usd: int  # uint64 - raw USD amount (6 decimals)
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenDelegateParams:
     validator: str  # address
     wei: int  # uint64
     is_undelegate: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class StakingParams:
     wei: int  # uint64
 
 
-@dataclass
+@dataclass(slots=True)
 class SpotSendParams:
     destination: str  # address
     token: int  # uint64 - token index
     wei: int  # uint64
 
 
-@dataclass
+@dataclass(slots=True)
 class UsdClassTransferParams:
     ntl: int  # uint64 - raw USD amount
     to_perp: bool  # True: Spot→Perp, False: Perp→Spot
 
 
-@dataclass
+@dataclass(slots=True)
 class FinalizeEvmContractParams:
     token: int  # uint64 - token index
     variant: int  # uint8
     create_nonce: int  # uint64
 
 
-@dataclass
+@dataclass(slots=True)
 class AddApiWalletParams:
     wallet: str  # address
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CancelOrderByOidParams:
     asset: int  # uint32
     oid: int  # uint64 - order ID
 
 
-@dataclass
+@dataclass(slots=True)
 class CancelOrderByCloidParams:
     asset: int  # uint32
     cloid: int  # uint128 - client order ID
 
 
-@dataclass
+@dataclass(slots=True)
 class ApproveBuilderFeeParams:
     max_fee_rate: int  # uint64
     builder: str  # address
 
 
-@dataclass
+@dataclass(slots=True)
 class SendAssetParams:
     dest: str  # address
     sub_account: str  # address
@@ -169,14 +292,14 @@ class SendAssetParams:
     wei: int  # uint64
 
 
-@dataclass
+@dataclass(slots=True)
 class ReflectEvmSupplyParams:
     token: int  # uint64
     wei: int  # uint64
     is_mint: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class BorrowLendOpParams:
     operation: int  # uint8 - 0=Deposit, 1=Withdraw, 2=Borrow, 3=Repay
     token: int  # uint64
@@ -186,7 +309,94 @@ class BorrowLendOpParams:
 @dataclass
 class TxResult:
     hash: str
-    receipt: Optional[Dict]
+    receipt: Optional[TxReceipt]  # web3 AttributeDict 그대로 보관 (복사 없음)
+
+    def as_dict(self) -> Optional[Dict]:
+        """receipt를 일반 dict로 변환 (필요할 때만)"""
+        return dict(self.receipt) if self.receipt is not None else None
+
+
+class SendManyError(Exception):
+    """
+    send_many 도중 실패 - 이미 브로드캐스트된 트랜잭션은 sent에 보관 (receipt=None)
+
+    원래 예외는 __cause__ 로 확인
+    """
+
+    def __init__(self, message: str, sent: List[TxResult]):
+        super().__init__(message)
+        self.sent = sent
+
+
+# ============================================
+# Action Decoders (build_* 의 역변환, header 포함 데이터 입력)
+# ============================================
+
+def _decode_limit_order(data: bytes) -> LimitOrderParams:
+    _, asset, is_buy, limit_px, sz, reduce_only, tif, cloid = _LIMIT_ORDER.unpack_from(data)
+    return LimitOrderParams(asset, is_buy, limit_px, sz, reduce_only, tif, int.from_bytes(cloid, "big"))
+
+
+def _decode_vault_transfer(data: bytes) -> VaultTransferParams:
+    _, vault, is_deposit, usd = _VAULT_TRANSFER.unpack_from(data)
+    return VaultTransferParams(Web3.to_checksum_address(vault), is_deposit, usd)
+
+
+def _decode_token_delegate(data: bytes) -> TokenDelegateParams:
+    _, validator, wei, is_undelegate = _TOKEN_DELEGATE.unpack_from(data)
+    return TokenDelegateParams(Web3.to_checksum_address(validator), wei, is_undelegate)
+
+
+def _decode_spot_send(data: bytes) -> SpotSendParams:
+    _, destination, token, wei = _SPOT_SEND.unpack_from(data)
+    return SpotSendParams(Web3.to_checksum_address(destination), token, wei)
+
+
+def _decode_add_api_wallet(data: bytes) -> AddApiWalletParams:
+    wallet, name = decode(["address", "string"], data[4:])
+    return AddApiWalletParams(Web3.to_checksum_address(wallet), name)
+
+
+def _decode_cancel_order_by_cloid(data: bytes) -> CancelOrderByCloidParams:
+    _, asset, cloid = _CANCEL_ORDER_BY_CLOID.unpack_from(data)
+    return CancelOrderByCloidParams(asset, int.from_bytes(cloid, "big"))
+
+
+def _decode_approve_builder_fee(data: bytes) -> ApproveBuilderFeeParams:
+    _, max_fee_rate, builder = _APPROVE_BUILDER_FEE.unpack_from(data)
+    return ApproveBuilderFeeParams(max_fee_rate, Web3.to_checksum_address(builder))
+
+
+def _decode_send_asset(data: bytes) -> SendAssetParams:
+    _, dest, sub_account, src_dex, dest_dex, token, wei = _SEND_ASSET.unpack_from(data)
+    return SendAssetParams(
+        Web3.to_checksum_address(dest), Web3.to_checksum_address(sub_account),
+        src_dex, dest_dex, token, wei
+    )
+
+
+def _decode_fixed(packer: struct.Struct, cls: type) -> Callable[[bytes], object]:
+    """주소/uint128 필드가 없는 action은 header를 제외한 unpack 결과를 그대로 사용"""
+    return lambda data: cls(*packer.unpack_from(data)[1:])
+
+
+_DECODERS: Dict[int, Callable[[bytes], object]] = {
+    ActionId.LIMIT_ORDER: _decode_limit_order,
+    ActionId.VAULT_TRANSFER: _decode_vault_transfer,
+    ActionId.TOKEN_DELEGATE: _decode_token_delegate,
+    ActionId.STAKING_DEPOSIT: _decode_fixed(_STAKING, StakingParams),
+    ActionId.STAKING_WITHDRAW: _decode_fixed(_STAKING, StakingParams),
+    ActionId.SPOT_SEND: _decode_spot_send,
+    ActionId.USD_CLASS_TRANSFER: _decode_fixed(_USD_CLASS_TRANSFER, UsdClassTransferParams),
+    ActionId.FINALIZE_EVM_CONTRACT: _decode_fixed(_FINALIZE_EVM_CONTRACT, FinalizeEvmContractParams),
+    ActionId.ADD_API_WALLET: _decode_add_api_wallet,
+    ActionId.CANCEL_ORDER_BY_OID: _decode_fixed(_CANCEL_ORDER_BY_OID, CancelOrderByOidParams),
+    ActionId.CANCEL_ORDER_BY_CLOID: _decode_cancel_order_by_cloid,
+    ActionId.APPROVE_BUILDER_FEE: _decode_approve_builder_fee,
+    ActionId.SEND_ASSET: _decode_send_asset,
+    ActionId.REFLECT_EVM_SUPPLY: _decode_fixed(_REFLECT_EVM_SUPPLY, ReflectEvmSupplyParams),
+    ActionId.BORROW_LEND_OP: _decode_fixed(_BORROW_LEND_OP, BorrowLendOpParams),
+}
 
 
 # ============================================
@@ -198,26 +408,23 @@ class HyperCoreWriter:
     HyperCore CoreWriter SDK for Python
     """
 
-    def __init__(self, rpc_url: str = RPC_URL):
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+    def __init__(self, rpc_url: str = RPC_URL, session: Optional[requests.Session] = None):
+        # keep-alive 세션을 재사용해 전송마다 TCP/TLS handshake 반복 방지
+        self.w3 = Web3(Web3.HTTPProvider(
+            rpc_url,
+            request_kwargs={"timeout": RPC_TIMEOUT},
+            session=session or requests.Session(),
+        ))
         self.core_writer = self.w3.eth.contract(
             address=Web3.to_checksum_address(CORE_WRITER_ADDRESS),
             abi=CORE_WRITER_ABI
         )
-
-    def _encode_header(self, action_id: int) -> bytes:
-        """버전 + action ID 헤더 생성 (4 bytes)"""
-        header = bytes([
-            VERSION,
-            (action_id >> 16) & 0xFF,
-            (action_id >> 8) & 0xFF,
-            action_id & 0xFF
-        ])
-        return header
-
-    def _concat_bytes(self, header: bytes, data: bytes) -> bytes:
-        """헤더 + ABI 인코딩 데이터 결합"""
-        return header + data
+        # ContractFunction을 한 번만 resolve
+        self._send_fn = self.core_writer.functions.sendRawAction
+        # gas/chainId 고정 필드 (chainId는 첫 전송 시 한 번만 조회)
+        self._tx_template: Optional[Dict] = None
+        # 엔드포인트가 JSON-RPC 배치를 거부하면 False로 바뀌고 _preflight는 순차 호출 사용
+        self._batch_preflight = True
 
     # ============================================
     # Action Builders
@@ -225,160 +432,293 @@ class HyperCoreWriter:
 
     def build_limit_order(self, params: LimitOrderParams) -> bytes:
         """Build Limit Order action data"""
-        header = self._encode_header(ActionId.LIMIT_ORDER)
-        data = encode(
-            ["uint32", "bool", "uint64", "uint64", "bool", "uint8", "uint128"],
-            [params.asset, params.is_buy, params.limit_px, params.sz,
-             params.reduce_only, params.encoded_tif, params.cloid]
+        return _LIMIT_ORDER.pack(
+            _HEADERS[ActionId.LIMIT_ORDER],
+            params.asset, params.is_buy, params.limit_px, params.sz,
+            params.reduce_only, params.encoded_tif, params.cloid.to_bytes(16, "big")
         )
-        return self._concat_bytes(header, data)
+
+    def build_limit_order_batch(self, orders: List[LimitOrderParams]) -> bytearray:
+        """
+        Build many Limit Order actions into one contiguous buffer
+
+        i번째 주문은 buf[i * LIMIT_ORDER_SIZE:(i + 1) * LIMIT_ORDER_SIZE]
+        """
+        header = _HEADERS[ActionId.LIMIT_ORDER]
+        pack_into = _LIMIT_ORDER.pack_into
+        buf = bytearray(LIMIT_ORDER_SIZE * len(orders))
+        offset = 0
+        for params in orders:
+            pack_into(
+                buf, offset, header,
+                params.asset, params.is_buy, params.limit_px, params.sz,
+                params.reduce_only, params.encoded_tif, params.cloid.to_bytes(16, "big")
+            )
+            offset += LIMIT_ORDER_SIZE
+        return buf
+
+    def build_limit_orders(
+        self,
+        asset: np.ndarray,
+        is_buy: np.ndarray,
+        limit_px: np.ndarray,
+        sz: np.ndarray,
+        reduce_only: np.ndarray,
+        encoded_tif: np.ndarray,
+        cloid_hi: Optional[np.ndarray] = None,
+        cloid_lo: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Build Limit Order actions from column arrays (SoA, NumPy only)
+
+        Returns: (N, LIMIT_ORDER_SIZE) uint8 배열 - 각 행은 build_limit_order 결과와 동일
+        cloid(uint128)는 상위/하위 64bit 컬럼으로 전달 (생략 시 0)
+        정수 컬럼만 허용, 값이 필드 범위(asset uint32, px/sz/cloid uint64, tif uint8)를
+        벗어나거나 컬럼 shape이 asset과 같은 (N,)이 아니면 ValueError
+        """
+        asset = np.asarray(asset)
+        if asset.ndim != 1:
+            raise ValueError(f"asset: 1-D column required, got shape {asset.shape}")
+        n = len(asset)
+        is_buy = _column(is_buy, n, "is_buy")
+        limit_px = _column(limit_px, n, "limit_px")
+        sz = _column(sz, n, "sz")
+        reduce_only = _column(reduce_only, n, "reduce_only")
+        encoded_tif = _column(encoded_tif, n, "encoded_tif")
+        if cloid_hi is not None:
+            cloid_hi = _column(cloid_hi, n, "cloid_hi")
+        if cloid_lo is not None:
+            cloid_lo = _column(cloid_lo, n, "cloid_lo")
+
+        out = np.zeros((n, LIMIT_ORDER_SIZE), dtype=np.uint8)
+        out[:, :4] = np.frombuffer(_HEADERS[ActionId.LIMIT_ORDER], dtype=np.uint8)
+        words = out[:, 4:].reshape(n, 7, 32)  # (주문, ABI word, byte) view
+
+        words[:, 0, 28:] = _be_columns(asset, ">u4", "asset")
+        words[:, 1, 31] = is_buy.astype(bool)
+        words[:, 2, 24:] = _be_columns(limit_px, ">u8", "limit_px")
+        words[:, 3, 24:] = _be_columns(sz, ">u8", "sz")
+        words[:, 4, 31] = reduce_only.astype(bool)
+        words[:, 5, 31] = _checked_uint(encoded_tif, "u1", "encoded_tif")
+        if cloid_hi is not None:
+            words[:, 6, 16:24] = _be_columns(cloid_hi, ">u8", "cloid_hi")
+        if cloid_lo is not None:
+            words[:, 6, 24:] = _be_columns(cloid_lo, ">u8", "cloid_lo")
+        return out
+
+    def specialize_limit_order(
+        self, asset: int, encoded_tif: int, reduce_only: bool = False
+    ) -> Callable[..., bytes]:
+        """
+        고정 (asset, tif, reduce_only) 조합 전용 Limit Order 빌더 생성 (마켓메이킹 호가용)
+
+        반환 함수: (is_buy, limit_px, sz, cloid=0) -> build_limit_order와 동일한 bytes
+        """
+        header = _HEADERS[ActionId.LIMIT_ORDER]
+        pack = _LIMIT_ORDER.pack
+        # 고정 필드 범위 검증은 생성 시 한 번만
+        pack(header, asset, False, 0, 0, reduce_only, encoded_tif, bytes(16))
+
+        def build(is_buy: bool, limit_px: int, sz: int, cloid: int = 0) -> bytes:
+            return pack(
+                header, asset, is_buy, limit_px, sz,
+                reduce_only, encoded_tif, cloid.to_bytes(16, "big")
+            )
+
+        return build
 
     def build_vault_transfer(self, params: VaultTransferParams) -> bytes:
         """Build Vault Transfer action data"""
-        header = self._encode_header(ActionId.VAULT_TRANSFER)
-        vault_addr = Web3.to_checksum_address(params.vault)
-        data = encode(
-            ["address", "bool", "uint64"],
-            [vault_addr, params.is_deposit, params.usd]
+        return _VAULT_TRANSFER.pack(
+            _HEADERS[ActionId.VAULT_TRANSFER],
+            _address_bytes(params.vault), params.is_deposit, params.usd
         )
-        return self._concat_bytes(header, data)
 
     def build_token_delegate(self, params: TokenDelegateParams) -> bytes:
         """Build Token Delegate action data"""
-        header = self._encode_header(ActionId.TOKEN_DELEGATE)
-        validator_addr = Web3.to_checksum_address(params.validator)
-        data = encode(
-            ["address", "uint64", "bool"],
-            [validator_addr, params.wei, params.is_undelegate]
+        return _TOKEN_DELEGATE.pack(
+            _HEADERS[ActionId.TOKEN_DELEGATE],
+            _address_bytes(params.validator), params.wei, params.is_undelegate
         )
-        return self._concat_bytes(header, data)
 
     def build_staking_deposit(self, params: StakingParams) -> bytes:
         """Build Staking Deposit action data"""
-        header = self._encode_header(ActionId.STAKING_DEPOSIT)
-        data = encode(["uint64"], [params.wei])
-        return self._concat_bytes(header, data)
+        return _STAKING.pack(_HEADERS[ActionId.STAKING_DEPOSIT], params.wei)
 
     def build_staking_withdraw(self, params: StakingParams) -> bytes:
         """Build Staking Withdraw action data"""
-        header = self._encode_header(ActionId.STAKING_WITHDRAW)
-        data = encode(["uint64"], [params.wei])
-        return self._concat_bytes(header, data)
+        return _STAKING.pack(_HEADERS[ActionId.STAKING_WITHDRAW], params.wei)
 
     def build_spot_send(self, params: SpotSendParams) -> bytes:
         """
         Build Spot Send action data
         ⚠️ 주의: 다른 주소로 토큰 전송 - 자금 손실 위험
         """
-        header = self._encode_header(ActionId.SPOT_SEND)
-        dest_addr = Web3.to_checksum_address(params.destination)
-        data = encode(
-            ["address", "uint64", "uint64"],
-            [dest_addr, params.token, params.wei]
+        return _SPOT_SEND.pack(
+            _HEADERS[ActionId.SPOT_SEND],
+            _address_bytes(params.destination), params.token, params.wei
         )
-        return self._concat_bytes(header, data)
 
     def build_usd_class_transfer(self, params: UsdClassTransferParams) -> bytes:
         """Build USD Class Transfer action data"""
-        header = self._encode_header(ActionId.USD_CLASS_TRANSFER)
-        data = encode(["uint64", "bool"], [params.ntl, params.to_perp])
-        return self._concat_bytes(header, data)
+        return _USD_CLASS_TRANSFER.pack(
+            _HEADERS[ActionId.USD_CLASS_TRANSFER],
+            params.ntl, params.to_perp
+        )
 
     def build_finalize_evm_contract(self, params: FinalizeEvmContractParams) -> bytes:
         """Build Finalize EVM Contract action data"""
-        header = self._encode_header(ActionId.FINALIZE_EVM_CONTRACT)
-        data = encode(
-            ["uint64", "uint8", "uint64"],
-            [params.token, params.variant, params.create_nonce]
+        return _FINALIZE_EVM_CONTRACT.pack(
+            _HEADERS[ActionId.FINALIZE_EVM_CONTRACT],
+            params.token, params.variant, params.create_nonce
         )
-        return self._concat_bytes(header, data)
 
     def build_add_api_wallet(self, params: AddApiWalletParams) -> bytes:
         """Build Add API Wallet action data"""
-        header = self._encode_header(ActionId.ADD_API_WALLET)
-        wallet_addr = Web3.to_checksum_address(params.wallet)
-        data = encode(["address", "string"], [wallet_addr, params.name])
-        return self._concat_bytes(header, data)
+        return _HEADERS[ActionId.ADD_API_WALLET] + _ADD_API_WALLET_ENCODER(
+            (_address_bytes(params.wallet), params.name)
+        )
 
     def build_cancel_order_by_oid(self, params: CancelOrderByOidParams) -> bytes:
         """Build Cancel Order by OID action data"""
-        header = self._encode_header(ActionId.CANCEL_ORDER_BY_OID)
-        data = encode(["uint32", "uint64"], [params.asset, params.oid])
-        return self._concat_bytes(header, data)
+        return _CANCEL_ORDER_BY_OID.pack(
+            _HEADERS[ActionId.CANCEL_ORDER_BY_OID],
+            params.asset, params.oid
+        )
 
     def build_cancel_order_by_cloid(self, params: CancelOrderByCloidParams) -> bytes:
         """Build Cancel Order by CLOID action data"""
-        header = self._encode_header(ActionId.CANCEL_ORDER_BY_CLOID)
-        data = encode(["uint32", "uint128"], [params.asset, params.cloid])
-        return self._concat_bytes(header, data)
+        return _CANCEL_ORDER_BY_CLOID.pack(
+            _HEADERS[ActionId.CANCEL_ORDER_BY_CLOID],
+            params.asset, params.cloid.to_bytes(16, "big")
+        )
 
     def build_approve_builder_fee(self, params: ApproveBuilderFeeParams) -> bytes:
         """Build Approve Builder Fee action data"""
-        header = self._encode_header(ActionId.APPROVE_BUILDER_FEE)
-        builder_addr = Web3.to_checksum_address(params.builder)
-        data = encode(["uint64", "address"], [params.max_fee_rate, builder_addr])
-        return self._concat_bytes(header, data)
+        return _APPROVE_BUILDER_FEE.pack(
+            _HEADERS[ActionId.APPROVE_BUILDER_FEE],
+            params.max_fee_rate, _address_bytes(params.builder)
+        )
 
     def build_send_asset(self, params: SendAssetParams) -> bytes:
         """
         Build Send Asset action data
         ⚠️ 주의: 다른 주소로 자산 전송 - 자금 손실 위험
         """
-        header = self._encode_header(ActionId.SEND_ASSET)
-        dest_addr = Web3.to_checksum_address(params.dest)
-        sub_addr = Web3.to_checksum_address(params.sub_account)
-        data = encode(
-            ["address", "address", "uint32", "uint32", "uint64", "uint64"],
-            [dest_addr, sub_addr, params.src_dex, params.dest_dex, params.token, params.wei]
+        return _SEND_ASSET.pack(
+            _HEADERS[ActionId.SEND_ASSET],
+            _address_bytes(params.dest), _address_bytes(params.sub_account),
+            params.src_dex, params.dest_dex, params.token, params.wei
         )
-        return self._concat_bytes(header, data)
 
     def build_reflect_evm_supply(self, params: ReflectEvmSupplyParams) -> bytes:
         """Build Reflect EVM Supply action data"""
-        header = self._encode_header(ActionId.REFLECT_EVM_SUPPLY)
-        data = encode(
-            ["uint64", "uint64", "bool"],
-            [params.token, params.wei, params.is_mint]
+        return _REFLECT_EVM_SUPPLY.pack(
+            _HEADERS[ActionId.REFLECT_EVM_SUPPLY],
+            params.token, params.wei, params.is_mint
         )
-        return self._concat_bytes(header, data)
 
     def build_borrow_lend_op(self, params: BorrowLendOpParams) -> bytes:
         """Build Borrow Lend Op action data (Testnet Only)"""
-        header = self._encode_header(ActionId.BORROW_LEND_OP)
-        data = encode(
-            ["uint8", "uint64", "uint64"],
-            [params.operation, params.token, params.wei]
+        return _BORROW_LEND_OP.pack(
+            _HEADERS[ActionId.BORROW_LEND_OP],
+            params.operation, params.token, params.wei
         )
-        return self._concat_bytes(header, data)
 
     # ============================================
     # Transaction Senders
     # ============================================
 
-    def send_raw_action(self, private_key: str, action_data: bytes) -> TxResult:
-        """Raw action 전송"""
-        account = self.w3.eth.account.from_key(private_key)
+    def _preflight(self, address: str) -> Tuple[int, int]:
+        """
+        nonce + gas price를 하나의 JSON-RPC 배치 요청으로 조회
 
-        # Build transaction
-        tx = self.core_writer.functions.sendRawAction(action_data).build_transaction({
+        배치(JSON-RPC array)를 지원하지 않는 엔드포인트면 순차 호출 2회로 fallback하고
+        이후로는 배치를 시도하지 않음
+        """
+        if self._batch_preflight:
+            try:
+                with self.w3.batch_requests() as batch:
+                    batch.add(self.w3.eth.get_transaction_count(address))
+                    batch.add(self.w3.eth.gas_price)
+                    nonce, gas_price = batch.execute()
+                return nonce, gas_price
+            except Exception:
+                self._batch_preflight = False
+        return self.w3.eth.get_transaction_count(address), self.w3.eth.gas_price
+
+    def _sign_action(
+        self, account: LocalAccount, action_data: bytes, nonce: int, gas_price: int
+    ) -> bytes:
+        """sendRawAction 트랜잭션 생성 + 서명"""
+        if self._tx_template is None:
+            self._tx_template = {
+                "gas": 100000,  # ~47,000 + buffer
+                "chainId": self.w3.eth.chain_id,
+            }
+        tx = self._send_fn(action_data).build_transaction({
+            **self._tx_template,
             "from": account.address,
-            "nonce": self.w3.eth.get_transaction_count(account.address),
-            "gas": 100000,  # ~47,000 + buffer
-            "gasPrice": self.w3.eth.gas_price,
+            "nonce": nonce,
+            "gasPrice": gas_price,
         })
+        signed_tx = account.sign_transaction(tx)
+        return signed_tx.raw_transaction
+
+    def send_raw_action(self, private_key: str, action_data: bytes) -> TxResult:
+        """Raw action 전송"""
+        account = _load_account(private_key)
+        nonce, gas_price = self._preflight(account.address)
 
         # Sign and send
-        signed_tx = self.w3.eth.account.sign_transaction(tx, private_key)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        raw_tx = self._sign_action(account, action_data, nonce, gas_price)
+        tx_hash = self.w3.eth.send_raw_transaction(raw_tx)
 
         # Wait for receipt
         receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
 
         return TxResult(
             hash=tx_hash.hex(),
-            receipt=dict(receipt)
+            receipt=receipt
         )
 
+    def send_many(
+        self, private_key: str, actions: List[bytes], max_workers: int = 8
+    ) -> List[TxResult]:
+        """
+        여러 raw action을 연속된 nonce로 전송
+
+        nonce/gas price는 한 번만 조회하고, 전송은 nonce 순서대로 한 뒤
+        receipt 대기는 스레드 풀에서 동시에 처리
+
+        Raises:
+            SendManyError: 전송 또는 receipt 대기 중 실패. 이미 전송된 트랜잭션
+                (nonce 순서, receipt=None)은 SendManyError.sent 로 확인
+        """
+        account = _load_account(private_key)
+        nonce, gas_price = self._preflight(account.address)
+
+        tx_hashes = []
+        try:
+            for i, action_data in enumerate(actions):
+                raw_tx = self._sign_action(account, action_data, nonce + i, gas_price)
+                tx_hashes.append(self.w3.eth.send_raw_transaction(raw_tx))
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                receipts = list(executor.map(self.w3.eth.wait_for_transaction_receipt, tx_hashes))
+        except Exception as e:
+            sent = [TxResult(hash=tx_hash.hex(), receipt=None) for tx_hash in tx_hashes]
+            raise SendManyError(
+                f"send_many failed after {len(sent)}/{len(actions)} transactions were sent "
+                f"(starting nonce {nonce})",
+                sent,
+            ) from e
+
+        return [
+            TxResult(hash=tx_hash.hex(), receipt=receipt)
+            for tx_hash, receipt in zip(tx_hashes, receipts)
+        ]
+
     def send_limit_order(self, private_key: str, params: LimitOrderParams) -> TxResult:
         return self.send_raw_action(private_key, self.build_limit_order(params))
 
@@ -429,28 +769,83 @@ class HyperCoreWriter:
     # ============================================
 
     def decode_action(self, data: bytes) -> dict:
-        """Decode action data (for debugging)"""
+        """
+        Decode action data (for debugging)
+
+        알려진 action ID는 "decoded"에 해당 Params 객체를 포함 (build_* 의 역변환)
+        params가 잘렸거나 형식이 맞지 않으면 "decoded"는 None (raw 필드는 그대로 반환)
+        """
         if isinstance(data, str):
             data = bytes.fromhex(data.replace("0x", ""))
 
-        version = data[0]
-        action_id = (data[1] << 16) | (data[2] << 8) | data[3]
+        (header,) = _HEADER.unpack_from(data)
+        version = header >> 24
+        action_id = header & 0xFFFFFF
         params = data[4:]
+        decoder = _DECODERS.get(action_id)
+        decoded = None
+        if decoder:
+            try:
+                decoded = decoder(data)
+            except (struct.error, DecodingError, ValueError):
+                pass
 
         return {
             "version": version,
             "action_id": action_id,
-            "params": "0x" + params.hex()
+            "params": "0x" + params.hex(),
+            "decoded": decoded,
         }
 
+    def decode_actions_bulk(self, payloads: List[bytes]) -> np.ndarray:
+        """
+        여러 action의 header를 한 번에 디코딩 (RawAction 로그 대량 수집용)
+
+        Returns: ACTION_HEADER_DTYPE 구조 배열 - action_id로 필터링 후
+                 decode_limit_orders 등 action 별 디코더로 전달
+        header(4 bytes)보다 짧은 payload가 있으면 ValueError (해당 인덱스 포함)
+        """
+        short = [i for i, p in enumerate(payloads) if len(p) < 4]
+        if short:
+            raise ValueError(
+                f"{len(short)} payload(s) shorter than the 4-byte action header "
+                f"(indices {short[:10]}{'...' if len(short) > 10 else ''})"
+            )
+        headers = np.frombuffer(b"".join(p[:4] for p in payloads), dtype=">u4")
+        out = np.empty(len(payloads), dtype=ACTION_HEADER_DTYPE)
+        out["version"] = headers >> 24
+        out["action_id"] = headers & 0xFFFFFF
+        return out
+
+    def decode_limit_orders(
+        self, data: Union[bytes, bytearray, np.ndarray, List[bytes]]
+    ) -> np.ndarray:
+        """
+        Limit Order action 여러 개를 복사 없이 LIMIT_ORDER_DTYPE 구조 배열로 해석
+
+        입력: 연속 버퍼 (build_limit_order_batch / build_limit_orders 결과) 또는 payload 리스트
+        ⚠️ header(action ID) 검증 없음 - decode_actions_bulk로 미리 필터링
+        """
+        if isinstance(data, list):
+            data = b"".join(data)
+        return np.frombuffer(data, dtype=LIMIT_ORDER_DTYPE)
+
 
 # ============================================
 # Utility Functions
 # ============================================
 
-def usd_to_raw(usd: float) -> int:
+Number = Union[int, float, str, Decimal]
+
+
+def _to_raw(value: Number, decimals: int) -> int:
+    """10진수 값을 정수 연산으로 스케일 (float 곱셈 반올림 오차 없음, 0 방향 절사)"""
+    return int(Decimal(str(value)).scaleb(decimals))
+
+
+def usd_to_raw(usd: Number) -> int:
     """USD를 raw value로 변환 (6 decimals)"""
-    return int(usd * 1e6)
+    return _to_raw(usd, 6)
 
 
 def raw_to_usd(raw: int) -> float:
@@ -458,14 +853,14 @@ def raw_to_usd(raw: int) -> float:
     return raw / 1e6
 
 
-def price_to_raw(price: float) -> int:
+def price_to_raw(price: Number) -> int:
     """Price를 raw value로 변환 (8 decimals)"""
-    return int(price * 1e8)
+    return _to_raw(price, 8)
 
 
-def size_to_raw(size: float, sz_decimals: int) -> int:
+def size_to_raw(size: Number, sz_decimals: int) -> int:
     """Size를 raw value로 변환"""
-    return int(size * (10 ** sz_decimals))
+    return _to_raw(size, sz_decimals)
 
 
 # ============================================
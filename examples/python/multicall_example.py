@@ -1,17 +1,35 @@
 """
 HyperCore Read Precompile Multicall 배치 호출 예제 (Python)
 
-web3.py와 Multicall3를 사용한 배치 호출 예제
+web3.py(AsyncWeb3)와 Multicall3를 사용한 배치 호출 예제
 
 Requirements:
-    pip install web3
+    pip install web3 numpy orjson
 """
 
-from typing import Dict, List, Optional, Tuple
+import asyncio
+import logging
+from contextlib import nullcontext
+from time import monotonic
+from typing import Any, Awaitable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
 from dataclasses import dataclass
-from web3 import Web3
+from functools import lru_cache, partial
+import struct
+import numpy as np
+import orjson
+from aiohttp import (
+    ClientConnectionError, ClientPayloadError, ClientResponse, ClientResponseError,
+    ClientSession, ClientTimeout, TCPConnector,
+)
+from web3 import AsyncWeb3, Web3, WebSocketProvider
+from web3.providers.rpc import AsyncHTTPProvider
+from web3.providers.rpc.utils import ExceptionRetryConfiguration
+from web3.types import RPCResponse
+from web3._utils.encoding import Web3JsonEncoder
 from eth_abi import encode, decode
 
+logger = logging.getLogger(__name__)
+
 # RPC 설정
 RPC_URL = "https://rpc.hyperliquid.xyz/evm"
 # RPC_URL = "http://hiksang01.iptime.org:3001/evm"  # 커스텀 RPC
@@ -32,63 +50,91 @@ PRECOMPILES = {
     "tokenSupply": "0x000000000000000000000000000000000000080d",
 }
 
-# Multicall3 ABI (aggregate3 함수)
-MULTICALL3_ABI = [
-    {
-        "inputs": [
-            {
-                "components": [
-                    {"name": "target", "type": "address"},
-                    {"name": "allowFailure", "type": "bool"},
-                    {"name": "callData", "type": "bytes"},
-                ],
-                "name": "calls",
-                "type": "tuple[]",
-            }
-        ],
-        "name": "aggregate3",
-        "outputs": [
-            {
-                "components": [
-                    {"name": "success", "type": "bool"},
-                    {"name": "returnData", "type": "bytes"},
-                ],
-                "name": "returnData",
-                "type": "tuple[]",
-            }
-        ],
-        "stateMutability": "view",
-        "type": "function",
-    }
-]
+# raw aggregate3 인코딩용 20-byte 주소 (매 호출 checksum 계산 / 문자열 파싱 없이 import 시 1회 변환)
+_PRECOMPILE_ADDRESSES = {
+    name: bytes.fromhex(addr[2:])
+    for name, addr in PRECOMPILES.items()
+}
+
+# Multicall3 aggregate3((address,bool,bytes)[]) -> (bool,bytes)[] selector
+AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")
 
+# examples/solidity/HyperCoreReader.sol - precompile을 한 번의 EVM 실행으로 읽어 packed blob 반환
+# reader_code만 주면 배포 없이 이 임의 주소에 state override로 올려 호출
+READER_OVERRIDE_ADDRESS = "0x0000000000000000000000000000000000C0FFEE"
+READ_USER_SNAPSHOT_SELECTOR = bytes(Web3.keccak(text="readUserSnapshot(address,uint32[],uint64[])")[:4])
 
-@dataclass
-class Position:
-    """포지션 데이터"""
-    perp_index: int
-    szi: int  # signed
-    entry_ntl: int
-    isolated_raw_usd: int
-    leverage: int
-    is_isolated: bool
+# 전체 조회 대상 개수
+TOTAL_PERPS = 225
+TOTAL_TOKENS = 425
 
-    @property
-    def is_long(self) -> bool:
-        return self.szi > 0
+# precompile별 multicall 1회당 최대 호출 수 (eth_call gas/시간 한도 내, 전체 조회를 가능한 한 1 RTT로)
+DEFAULT_BATCH_SIZES = {
+    "markPx": 225,
+    "position": 225,
+    "spotBalance": 425,
+    "perpAssetInfo": 64,
+}
 
-    @property
-    def is_short(self) -> bool:
-        return self.szi < 0
+# _probe_batch_size가 차례로 시도하는 배치 크기
+PROBE_BATCH_SIZES = (64, 128, 225, 300, 425, 600, 800)
+PROBE_USER = "0x0000000000000000000000000000000000000000"
 
+# snapshot()을 aggregate3 한 번으로 보낼 수 있는 최대 calldata 크기 (초과 시 precompile별 조회로 분할)
+MAX_SNAPSHOT_CALLDATA = 512 * 1024
 
-@dataclass
-class SpotBalance:
-    """스팟 잔액 데이터"""
-    token_index: int
-    total: int
-    hold: int
-    entry_ntl: int
+# TTL 캐시 기본값 (초) - 마크 가격은 UI 폴링 수준, perpAssetInfo는 거의 변하지 않음
+MARK_PRICE_TTL = 0.25
+PERP_ASSET_INFO_TTL = 300.0
+
+# watch_mark_prices 결과를 get_mark_price로 읽을 때 허용하는 최대 경과 시간 (초)
+MARK_PRICE_MAX_AGE = 5.0
+
+# watch_mark_prices WebSocket 재연결 백오프 (초) - 연결 성공 시 초기값으로 리셋
+WS_RECONNECT_BACKOFF = 0.5
+WS_RECONNECT_BACKOFF_MAX = 30.0
+
+# HTTP 설정 - web3 기본 세션은 force_close(요청마다 새 연결)이므로 keep-alive 풀을 직접 구성
+RPC_TIMEOUT = 10
+MAX_CONNECTIONS_PER_HOST = 32
+KEEPALIVE_TIMEOUT = 30
+
+# 클라이언트 측 eth_call 속도 제한 (공개 RPC 429 방지, None이면 비활성)
+REQUESTS_PER_SECOND = 20.0
+
+# 재시도 대상 HTTP 상태 - 400 / 413 등 나머지 4xx는 재시도해도 결과가 같으므로 즉시 실패
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class _RetryableStatusError(ClientResponseError):
+    """RETRYABLE_STATUSES 응답 (_raise_for_status가 발생, RPC_RETRY 재시도 대상)"""
+
+
+# 429 / 5xx / 연결 오류 / 타임아웃 재시도 (지수 백오프: 0.2, 0.4, 0.8, 1.6초)
+RPC_RETRY = ExceptionRetryConfiguration(
+    errors=(_RetryableStatusError, ClientConnectionError, ClientPayloadError, asyncio.TimeoutError),
+    retries=5,
+    backoff_factor=0.2,
+)
+
+
+# 포지션 / 스팟 잔액은 행별 객체 대신 NumPy structured array(SoA)로 반환
+# (필터링 / PnL 계산을 arr[arr["szi"] != 0] 처럼 벡터 연산으로 처리)
+POSITION_DTYPE = np.dtype([
+    ("perp_index", "u2"),
+    ("szi", "i8"),  # signed, > 0: long, < 0: short
+    ("entry_ntl", "u8"),
+    ("isolated_raw_usd", "i8"),
+    ("leverage", "u4"),
+    ("is_isolated", "?"),
+])
+
+SPOT_BALANCE_DTYPE = np.dtype([
+    ("token_index", "u8"),
+    ("total", "u8"),
+    ("hold", "u8"),
+    ("entry_ntl", "u8"),
+])
 
 
 @dataclass
@@ -102,75 +148,608 @@ class PerpAssetInfo:
     only_isolated: bool
 
 
-def chunk_list(lst: List, chunk_size: int) -> List[List]:
-    """리스트를 청크로 분할"""
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+def _chunks(n: int, size: int) -> Iterator[range]:
+    """0..n-1 인덱스를 size 단위 range로 분할 (인덱스 리스트를 만들지 않음)"""
+    return (range(i, min(i + size, n)) for i in range(0, n, size))
 
 
-class HyperCoreMulticall:
+@lru_cache(maxsize=128)
+def _checksum(addr: str) -> str:
+    """사용자 주소 checksum 캐시 (keccak 계산을 배치마다 반복하지 않음)"""
+    return Web3.to_checksum_address(addr)
+
+
+# 인덱스별 precompile calldata는 항상 같으므로 캐시 (폴링마다 재인코딩 방지)
+@lru_cache(maxsize=1024)
+def _encode_uint32(idx: int) -> bytes:
+    return encode(["uint32"], [idx])
+
+
+@lru_cache(maxsize=4096)
+def _encode_addr_uint16(user: str, idx: int) -> bytes:
+    return encode(["address", "uint16"], [user, idx])
+
+
+@lru_cache(maxsize=4096)
+def _encode_addr_uint64(user: str, idx: int) -> bytes:
+    return encode(["address", "uint64"], [user, idx])
+
+
+# 정적 반환 타입 precompile 결과의 고정 오프셋 디코더 (32-byte ABI word, big-endian)
+_MARK_PRICE_WORDS = struct.Struct(">24xQ")                   # uint64
+_POSITION_WORDS = struct.Struct(">24xq24xQ24xq28xI31x?")     # int64, uint64, int64, uint32, bool
+_SPOT_BALANCE_WORDS = struct.Struct(">24xQ24xQ24xQ")         # uint64 x 3
+
+# 정상 반환 길이 (길이가 다르면 디코딩하지 않고 로그만 남김)
+MARK_PRICE_RETURN_SIZE = _MARK_PRICE_WORDS.size        # 32
+POSITION_RETURN_SIZE = _POSITION_WORDS.size            # 160
+SPOT_BALANCE_RETURN_SIZE = _SPOT_BALANCE_WORDS.size    # 96
+PERP_ASSET_INFO_MIN_SIZE = 7 * 32  # tuple offset + 5 head words + string length
+
+# ABI head의 offset / length word (하위 8 byte만 읽음 - 노드 응답 크기상 상위 byte는 항상 0)
+_ABI_UINT = struct.Struct(">24xQ").unpack_from
+
+
+def _decode_aggregate3_result(raw: bytes) -> List[Tuple[bool, bytes]]:
+    """
+    aggregate3 반환값 (bool,bytes)[] 를 offset을 직접 따라가며 디코딩
+
+    eth_abi decode와 같은 결과를 내지만 타입 객체 / 스트림 없이 word 단위로만 읽음
+    빈 응답(Multicall3 미배포) 또는 offset / length가 응답 밖을 가리키면 ValueError
+    """
+    data = bytes(raw)
+    size = len(data)
+    if size < 64:
+        raise ValueError(
+            f"aggregate3: response too short ({size} bytes) - is Multicall3 deployed at "
+            f"{MULTICALL3_ADDRESS} (or passed via multicall3_code)?"
+        )
+    results = []
+
+    try:
+        array_start = _ABI_UINT(data, 0)[0]
+        length = _ABI_UINT(data, array_start)[0]
+        heads = array_start + 32
+        for i in range(length):
+            tuple_start = heads + _ABI_UINT(data, heads + 32 * i)[0]
+            bytes_start = tuple_start + _ABI_UINT(data, tuple_start + 32)[0]
+            bytes_end = bytes_start + 32 + _ABI_UINT(data, bytes_start)[0]
+            if bytes_end > size:
+                raise IndexError
+            results.append((data[tuple_start + 31] != 0, data[bytes_start + 32:bytes_end]))
+    except (struct.error, IndexError):
+        raise ValueError(
+            f"aggregate3: malformed response ({size} bytes, failed at result {len(results)})"
+        ) from None
+
+    return results
+
+
+# HyperCoreReader blob 레코드 (고정 stride, big-endian, ok=0이면 precompile 호출 실패)
+_READER_MARK_PX_DTYPE = np.dtype([("ok", "?"), ("mark_px", ">u8")])
+_READER_POSITION_DTYPE = np.dtype([
+    ("ok", "?"),
+    ("szi", ">i8"),
+    ("entry_ntl", ">u8"),
+    ("isolated_raw_usd", ">i8"),
+    ("leverage", ">u4"),
+    ("is_isolated", "?"),
+])
+_READER_SPOT_BALANCE_DTYPE = np.dtype([
+    ("ok", "?"),
+    ("total", ">u8"),
+    ("hold", ">u8"),
+    ("entry_ntl", ">u8"),
+])
+
+
+@lru_cache(maxsize=128)
+def _encode_reader_snapshot(user: str) -> bytes:
+    """readUserSnapshot(user, 전체 perp, 전체 토큰) calldata (사용자별 캐시)"""
+    return READ_USER_SNAPSHOT_SELECTOR + encode(
+        ["address", "uint32[]", "uint64[]"],
+        [user, range(TOTAL_PERPS), range(TOTAL_TOKENS)],
+    )
+
+
+def _from_reader_rows(rows: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """ok인 reader 레코드만 골라 dtype(첫 필드 = 인덱스)으로 변환"""
+    ok = rows["ok"]
+    out = np.empty(int(ok.sum()), dtype)
+    out[dtype.names[0]] = np.flatnonzero(ok)
+    for name in dtype.names[1:]:
+        out[name] = rows[name][ok]
+    return out
+
+
+# TTL 캐시: {key: (만료 시각(monotonic), 값 또는 조회 실패 시 None)}
+TTLCache = Dict[int, Tuple[float, Any]]
+
+
+def _split_cached(cache: TTLCache, keys: Iterable[int]) -> Tuple[Dict[int, Any], List[int]]:
+    """만료되지 않은 캐시 값과 다시 조회해야 할 key를 분리"""
+    now = monotonic()
+    hits = {}
+    missing = []
+    for key in keys:
+        entry = cache.get(key)
+        if entry is not None and entry[0] > now:
+            if entry[1] is not None:
+                hits[key] = entry[1]
+        else:
+            missing.append(key)
+    return hits, missing
+
+
+def _store_cached(cache: TTLCache, keys: Iterable[int], values: Dict[int, Any], ttl: float) -> None:
+    """조회 결과 저장 (실패한 key도 None으로 저장해 TTL 동안 재조회하지 않음)"""
+    expires_at = monotonic() + ttl
+    for key in keys:
+        cache[key] = (expires_at, values.get(key))
+
+
+class RateLimiter:
+    """
+    asyncio token bucket rate limiter
+
+    초당 rate개씩 토큰을 채우고 최대 burst개까지 몰아서 허용 (async with 로 사용)
     """
-    Multicall3를 사용한 HyperCore Read Precompile 배치 호출 클래스
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst or rate
+        self.tokens = self.capacity
+        self.updated_at = monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 0.0
+                self.updated_at = monotonic()
+            else:
+                self.tokens -= 1
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+class OrjsonAsyncHTTPProvider(AsyncHTTPProvider):
     """
+    JSON-RPC 요청 / 응답을 orjson으로 직렬화하는 AsyncHTTPProvider
 
-    def __init__(self, rpc_url: str = RPC_URL):
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
-        self.multicall = self.w3.eth.contract(
-            address=Web3.to_checksum_address(MULTICALL3_ADDRESS),
-            abi=MULTICALL3_ABI
+    수십 KB hex 문자열인 aggregate3 응답 파싱을 stdlib json 대신 orjson으로 처리
+    orjson이 모르는 타입(HexBytes, AttributeDict 등)은 web3 기본 encoder로 넘김
+    """
+
+    _json_default = Web3JsonEncoder().default
+
+    @staticmethod
+    def encode_rpc_dict(rpc_dict: Dict[str, Any]) -> bytes:
+        return orjson.dumps(rpc_dict, default=OrjsonAsyncHTTPProvider._json_default)
+
+    @staticmethod
+    def decode_rpc_response(raw_response: bytes) -> RPCResponse:
+        return orjson.loads(raw_response)
+
+
+async def _raise_for_status(response: ClientResponse) -> None:
+    """429/5xx는 _RetryableStatusError(재시도), 나머지 4xx는 일반 ClientResponseError(즉시 실패)"""
+    if response.status in RETRYABLE_STATUSES:
+        response.release()
+        raise _RetryableStatusError(
+            response.request_info, response.history,
+            status=response.status, message=response.reason or "", headers=response.headers,
         )
+    response.raise_for_status()
+
 
-    def _encode_call(self, target: str, calldata: bytes) -> Tuple[str, bool, bytes]:
+def _new_http_session() -> ClientSession:
+    """keep-alive 커넥션 풀 세션 (_raise_for_status로 재시도 대상 상태만 구분)"""
+    return ClientSession(
+        raise_for_status=_raise_for_status,
+        connector=TCPConnector(
+            limit_per_host=MAX_CONNECTIONS_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ),
+    )
+
+
+def _encode_aggregate3(calls: List[Tuple[bytes, bool, bytes]]) -> bytes:
+    """aggregate3 calldata 직접 인코딩 (selector + (address,bool,bytes)[])"""
+    return AGGREGATE3_SELECTOR + encode(["(address,bool,bytes)[]"], [calls])
+
+
+_UINT32 = struct.Struct(">I")
+
+
+@lru_cache(maxsize=64)
+def _aggregate3_uint32_template(precompile: str, n: int) -> Tuple[bytes, Tuple[int, ...]]:
+    """
+    uint32 인자 하나를 받는 precompile n개 호출의 aggregate3 calldata 템플릿
+
+    길이가 같으면 selector / offset / 배열 길이 / target / calldata 길이는 모두 동일하므로
+    인덱스 0으로 한 번 인코딩해두고 각 호출의 uint32 위치(하위 4 byte)만 기록
+
+    Returns:
+        (템플릿 calldata, 호출별 uint32 byte offset)
+    """
+    target = _PRECOMPILE_ADDRESSES[precompile]
+    template = _encode_aggregate3([(target, True, _encode_uint32(0))] * n)
+
+    # selector 뒤: [배열 offset][길이][head offset x n] / 각 tuple: [target][allowFailure][bytes offset][길이][uint32]
+    heads = len(AGGREGATE3_SELECTOR) + 64
+    offsets = tuple(
+        heads + _ABI_UINT(template, heads + 32 * i)[0] + 4 * 32 + 28
+        for i in range(n)
+    )
+    return template, offsets
+
+
+def _encode_uint32_aggregate3(precompile: str, indices: Sequence[int]) -> bytes:
+    """템플릿을 복사해 인덱스만 채워 넣는 aggregate3 calldata 인코딩 (eth_abi 호출 없음)"""
+    template, offsets = _aggregate3_uint32_template(precompile, len(indices))
+    payload = bytearray(template)
+    pack_into = _UINT32.pack_into
+
+    for offset, idx in zip(offsets, indices):
+        pack_into(payload, offset, idx)
+
+    return bytes(payload)
+
+
+@lru_cache(maxsize=16)
+def _encode_snapshot_aggregate3(user: str) -> bytes:
+    """
+    snapshot()용 전체 markPx + position + spotBalance aggregate3 calldata (사용자별 캐시)
+
+    사용자 주소와 고정 인덱스 범위에만 의존 (~189 KB, 인코딩 ~18ms) - 메모리를 고려해 16명까지만 보관
+    """
+    perps = range(TOTAL_PERPS)
+    return _encode_aggregate3(
+        [(_PRECOMPILE_ADDRESSES["markPx"], True, _encode_uint32(idx)) for idx in perps]
+        + [(_PRECOMPILE_ADDRESSES["position"], True, _encode_addr_uint16(user, idx)) for idx in perps]
+        + [
+            (_PRECOMPILE_ADDRESSES["spotBalance"], True, _encode_addr_uint64(user, idx))
+            for idx in range(TOTAL_TOKENS)
+        ]
+    )
+
+
+async def fetch_multicall3_code(rpc_url: str = RPC_URL) -> bytes:
+    """
+    Multicall3가 배포된 체인에서 런타임 바이트코드 조회
+
+    Multicall3가 없는 RPC에서 AsyncHyperCoreMulticall(multicall3_code=...)로 넘겨 사용
+    """
+    w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_url))
+    try:
+        return bytes(await w3.eth.get_code(MULTICALL3_ADDRESS))
+    finally:
+        await w3.provider.disconnect()
+
+
+class AsyncHyperCoreMulticall:
+    """
+    Multicall3를 사용한 HyperCore Read Precompile 배치 호출 클래스 (asyncio)
+
+    get_all_* 는 청크별 multicall을 동시에 전송 (keep-alive 세션 공유)
+    마크 가격 / perpAssetInfo는 perp index 별 TTL 캐시 적용 (ttl=0이면 비활성)
+    fast=True: aggregate3 / precompile 결과를 오프셋으로 직접 디코딩, False: eth_abi decode 사용
+    rps: 초당 eth_call 수 제한 (None이면 비활성), 429/5xx는 지수 백오프로 재시도
+    batch_sizes: precompile별 multicall 1회당 호출 수 (DEFAULT_BATCH_SIZES 일부만 덮어써도 됨)
+    multicall3_code: 주어지면 eth_call state override로 MULTICALL3_ADDRESS에 이 코드를 올려 실행
+                     (Multicall3가 배포되지 않은 커스텀 RPC / 로컬 노드용, fetch_multicall3_code 참고)
+    reader_code / reader_address: HyperCoreReader 런타임 코드(state override) 또는 배포 주소
+                     설정 시 snapshot()은 aggregate3 대신 reader 한 번 호출로 조회
+    """
+
+    def __init__(
+        self,
+        rpc_url: str = RPC_URL,
+        mark_ttl: float = MARK_PRICE_TTL,
+        info_ttl: float = PERP_ASSET_INFO_TTL,
+        fast: bool = True,
+        rps: Optional[float] = REQUESTS_PER_SECOND,
+        batch_sizes: Optional[Dict[str, int]] = None,
+        multicall3_code: Optional[bytes] = None,
+        reader_code: Optional[bytes] = None,
+        reader_address: Optional[str] = None,
+    ):
+        self.w3 = AsyncWeb3(
+            OrjsonAsyncHTTPProvider(
+                rpc_url,
+                request_kwargs={"timeout": ClientTimeout(total=RPC_TIMEOUT)},
+                exception_retry_configuration=RPC_RETRY,
+            )
+        )
+        # eth_call 전용이므로 기본 middleware(ENS, attrdict, validation, gas 추정) 제거
+        # (validation은 eth_call마다 eth_chainId 요청을 추가로 보냄)
+        self.w3.middleware_onion.clear()
+        self._session_ready: Optional[asyncio.Future] = None
+        self._limiter = RateLimiter(rps) if rps else nullcontext()
+        self._state_override = (
+            {MULTICALL3_ADDRESS: {"code": multicall3_code}} if multicall3_code else None
+        )
+        self._reader_address = (
+            _checksum(reader_address) if reader_address
+            else READER_OVERRIDE_ADDRESS if reader_code else None
+        )
+        self._reader_override = (
+            {self._reader_address: {"code": reader_code}} if reader_code else None
+        )
+        if fast:
+            self._decode_aggregate3 = _decode_aggregate3_result
+            self._decode_mark_price = _MARK_PRICE_WORDS.unpack_from
+            self._decode_position = _POSITION_WORDS.unpack_from
+            self._decode_spot_balance = _SPOT_BALANCE_WORDS.unpack_from
+        else:
+            self._decode_aggregate3 = lambda raw: decode(["(bool,bytes)[]"], raw)[0]
+            self._decode_mark_price = partial(decode, ["uint64"])
+            self._decode_position = partial(decode, ["int64", "uint64", "int64", "uint32", "bool"])
+            self._decode_spot_balance = partial(decode, ["uint64", "uint64", "uint64"])
+        self.mark_ttl = mark_ttl
+        self.info_ttl = info_ttl
+        self._mark_cache: TTLCache = {}
+        self._info_cache: TTLCache = {}
+        # 마지막 전체 마크 가격 조회 결과 (watch_mark_prices가 블록마다 갱신)
+        self._mark_prices: Dict[int, int] = {}
+        self._mark_prices_at = float("-inf")
+        self.batch_sizes = {**DEFAULT_BATCH_SIZES, **(batch_sizes or {})}
+        self._build_mark_price_payloads()
+
+    def _build_mark_price_payloads(self) -> None:
+        """전체 perp 마크 가격 조회용 aggregate3 payload (청크별) 미리 인코딩"""
+        self._all_mark_price_payloads = [
+            (chunk, _encode_uint32_aggregate3("markPx", chunk))
+            for chunk in _chunks(TOTAL_PERPS, self.batch_sizes["markPx"])
+        ]
+
+    def _encode_call(self, target: bytes, calldata: bytes) -> Tuple[bytes, bool, bytes]:
         """Multicall3 호출 데이터 생성"""
-        return (Web3.to_checksum_address(target), True, calldata)
+        return (target, True, calldata)
 
-    def batch_get_mark_prices(self, perp_indices: List[int]) -> Dict[int, int]:
+    async def _ensure_session(self) -> None:
         """
-        여러 perp의 마크 가격을 배치로 조회
+        keep-alive 세션을 provider에 한 번만 등록
+
+        동시에 시작된 첫 호출들이 web3 기본 세션을 만들지 않도록 등록 작업 하나를 공유
+        """
+        if self._session_ready is None:
+            self._session_ready = asyncio.ensure_future(
+                self.w3.provider.cache_async_session(_new_http_session())
+            )
+        await self._session_ready
+
+    async def _eth_call(
+        self, to: str, payload: bytes, state_override: Optional[Dict[str, Any]]
+    ) -> bytes:
+        """rate limit을 적용해 eth_call 한 번 전송"""
+        await self._ensure_session()
+        async with self._limiter:
+            return await self.w3.eth.call({"to": to, "data": payload}, "latest", state_override)
+
+    async def _send_aggregate3(self, payload: bytes) -> List[Tuple[bool, bytes]]:
+        """인코딩된 aggregate3 calldata를 eth_call 한 번으로 전송"""
+        raw = await self._eth_call(MULTICALL3_ADDRESS, payload, self._state_override)
+        return self._decode_aggregate3(raw)
+
+    async def _raw_multicall(self, calls: List[Tuple[bytes, bool, bytes]]) -> List[Tuple[bool, bytes]]:
+        """
+        aggregate3 calldata를 직접 인코딩해 eth_call 한 번으로 전송
+
+        Contract/ContractFunction 객체 생성과 ABI 조회 없이 selector + 인자만 인코딩
+        """
+        return await self._send_aggregate3(_encode_aggregate3(calls))
+
+    async def _probe_batch_size(self, precompile: str) -> int:
+        """
+        eth_call이 실패할 때까지 배치 크기를 늘려보고 성공한 최대 크기를 batch_sizes에 저장
 
         Args:
-            perp_indices: perp 인덱스 리스트
+            precompile: "markPx" | "position" | "spotBalance" | "perpAssetInfo"
 
         Returns:
-            {perp_index: mark_price} 딕셔너리
+            성공한 최대 배치 크기 (모두 실패하면 0, batch_sizes는 그대로)
         """
-        calls = [
-            self._encode_call(
-                PRECOMPILES["markPx"],
-                encode(["uint32"], [idx])
-            )
+        if precompile == "position":
+            encode_args = partial(_encode_addr_uint16, PROBE_USER)
+        elif precompile == "spotBalance":
+            encode_args = partial(_encode_addr_uint64, PROBE_USER)
+        else:
+            encode_args = _encode_uint32
+
+        ceiling = 0
+        for size in PROBE_BATCH_SIZES:
+            calls = [
+                self._encode_call(_PRECOMPILE_ADDRESSES[precompile], encode_args(idx))
+                for idx in range(size)
+            ]
+            try:
+                await self._raw_multicall(calls)
+            except Exception:
+                break
+            ceiling = size
+
+        if ceiling:
+            self.batch_sizes[precompile] = ceiling
+            if precompile == "markPx":
+                self._build_mark_price_payloads()
+
+        return ceiling
+
+    def _parse_mark_prices(
+        self, perp_indices: Sequence[int], results: List[Tuple[bool, bytes]]
+    ) -> Dict[int, int]:
+        prices = {}
+
+        for i, (success, return_data) in enumerate(results):
+            if not success:
+                continue
+            if len(return_data) == MARK_PRICE_RETURN_SIZE:
+                prices[perp_indices[i]] = self._decode_mark_price(return_data)[0]
+            else:
+                logger.warning("markPx %d: unexpected return size %d", perp_indices[i], len(return_data))
+
+        return prices
+
+    def _position_calls(self, user_addr: str, perp_indices: Sequence[int]) -> List[Tuple[bytes, bool, bytes]]:
+        return [
+            self._encode_call(_PRECOMPILE_ADDRESSES["position"], _encode_addr_uint16(user_addr, idx))
             for idx in perp_indices
         ]
 
-        results = self.multicall.functions.aggregate3(calls).call()
-        prices = {}
+    def _parse_positions(
+        self, perp_indices: Sequence[int], results: List[Tuple[bool, bytes]]
+    ) -> np.ndarray:
+        rows = []
 
         for i, (success, return_data) in enumerate(results):
-            if success and len(return_data) > 0:
-                price = decode(["uint64"], return_data)[0]
-                prices[perp_indices[i]] = price
+            if not success:
+                continue
+            if len(return_data) == POSITION_RETURN_SIZE:
+                rows.append((perp_indices[i], *self._decode_position(return_data)))
+            else:
+                logger.warning("position %d: unexpected return size %d", perp_indices[i], len(return_data))
+
+        return np.array(rows, dtype=POSITION_DTYPE)
+
+    def _spot_balance_calls(self, user_addr: str, token_indices: Sequence[int]) -> List[Tuple[bytes, bool, bytes]]:
+        return [
+            self._encode_call(_PRECOMPILE_ADDRESSES["spotBalance"], _encode_addr_uint64(user_addr, idx))
+            for idx in token_indices
+        ]
 
-        return prices
+    def _parse_spot_balances(
+        self, token_indices: Sequence[int], results: List[Tuple[bool, bytes]]
+    ) -> np.ndarray:
+        rows = []
 
-    def get_all_mark_prices(self) -> Dict[int, int]:
+        for i, (success, return_data) in enumerate(results):
+            if not success:
+                continue
+            if len(return_data) == SPOT_BALANCE_RETURN_SIZE:
+                rows.append((token_indices[i], *self._decode_spot_balance(return_data)))
+            else:
+                logger.warning("spotBalance %d: unexpected return size %d", token_indices[i], len(return_data))
+
+        return np.array(rows, dtype=SPOT_BALANCE_DTYPE)
+
+    async def batch_get_mark_prices(self, perp_indices: Sequence[int]) -> Dict[int, int]:
         """
-        전체 perp 마크 가격 조회 (최적 배치 크기: 200)
+        여러 perp의 마크 가격을 배치로 조회
+
+        Args:
+            perp_indices: perp 인덱스 리스트
 
         Returns:
             {perp_index: mark_price} 딕셔너리
         """
-        total_perps = 225
-        batch_size = 200
-        all_indices = list(range(total_perps))
-        chunks = chunk_list(all_indices, batch_size)
+        prices, missing = _split_cached(self._mark_cache, perp_indices)
+
+        if missing:
+            results = await self._send_aggregate3(_encode_uint32_aggregate3("markPx", missing))
+            fetched = self._parse_mark_prices(missing, results)
+            _store_cached(self._mark_cache, missing, fetched, self.mark_ttl)
+            prices.update(fetched)
+
+        return {idx: prices[idx] for idx in perp_indices if idx in prices}
+
+    async def get_all_mark_prices(self) -> Dict[int, int]:
+        """
+        전체 perp 마크 가격 조회 (batch_sizes["markPx"] 단위 청크)
+
+        Returns:
+            {perp_index: mark_price} 딕셔너리
+        """
+        all_prices, missing = _split_cached(self._mark_cache, range(TOTAL_PERPS))
+        if not missing:
+            return all_prices
+
+        return await self._refresh_mark_prices()
+
+    async def _refresh_mark_prices(self) -> Dict[int, int]:
+        """캐시와 무관하게 전체 마크 가격을 조회해 TTL 캐시와 _mark_prices 갱신"""
+        chunk_results = await asyncio.gather(
+            *(self._send_aggregate3(payload) for _, payload in self._all_mark_price_payloads)
+        )
 
         all_prices = {}
-        for chunk in chunks:
-            prices = self.batch_get_mark_prices(chunk)
-            all_prices.update(prices)
+        for (chunk, _), results in zip(self._all_mark_price_payloads, chunk_results):
+            all_prices.update(self._parse_mark_prices(chunk, results))
 
+        _store_cached(self._mark_cache, range(TOTAL_PERPS), all_prices, self.mark_ttl)
+        self._mark_prices = all_prices
+        self._mark_prices_at = monotonic()
         return all_prices
 
-    def batch_get_positions(self, user: str, perp_indices: List[int]) -> List[Position]:
+    async def watch_mark_prices(self, ws_url: str) -> None:
+        """
+        newHeads WebSocket 구독으로 새 블록마다 전체 마크 가격 갱신 (취소될 때까지 실행)
+
+        폴링 대신 백그라운드 task로 띄워두고 get_mark_price로 읽음
+            task = asyncio.create_task(client.watch_mark_prices(ws_url))
+
+        Args:
+            ws_url: eth_subscribe("newHeads")를 지원하는 노드의 WebSocket 엔드포인트
+
+        갱신 실패는 경고만 남기고 다음 블록에서 재시도,
+        연결이 끊기면 지수 백오프(WS_RECONNECT_BACKOFF ~ WS_RECONNECT_BACKOFF_MAX)로 재연결
+        갱신이 블록 간격보다 오래 걸리면 그동안 쌓인 블록은 한 번의 갱신으로 합침
+        (진행 중 1회 + 대기 1회까지만)
+        """
+        refresh_requested = asyncio.Event()
+        refresher = asyncio.create_task(self._mark_price_refresher(refresh_requested))
+        backoff = WS_RECONNECT_BACKOFF
+        try:
+            while True:
+                try:
+                    async with AsyncWeb3(WebSocketProvider(ws_url)) as ws_w3:
+                        ws_w3.middleware_onion.clear()
+                        await ws_w3.eth.subscribe("newHeads")
+                        backoff = WS_RECONNECT_BACKOFF
+                        refresh_requested.set()
+                        async for _ in ws_w3.socket.process_subscriptions():
+                            refresh_requested.set()
+                    logger.warning("newHeads subscription closed, reconnecting in %.1fs", backoff)
+                except Exception as e:
+                    logger.warning("newHeads subscription failed (%r), reconnecting in %.1fs", e, backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, WS_RECONNECT_BACKOFF_MAX)
+        finally:
+            refresher.cancel()
+
+    async def _mark_price_refresher(self, refresh_requested: asyncio.Event) -> None:
+        """refresh_requested가 set될 때마다 전체 마크 가격 갱신 (watch_mark_prices 전용, 한 번에 1회만 실행)"""
+        while True:
+            await refresh_requested.wait()
+            refresh_requested.clear()
+            try:
+                await self._refresh_mark_prices()
+            except Exception:
+                logger.warning("mark price refresh failed", exc_info=True)
+
+    def get_mark_price(self, perp_index: int, max_age: float = MARK_PRICE_MAX_AGE) -> Optional[int]:
+        """
+        마지막으로 조회된 마크 가격 (RPC 호출 없음)
+
+        Returns:
+            마크 가격, 마지막 갱신 후 max_age초가 지났거나 조회 실패한 perp면 None
+        """
+        if monotonic() - self._mark_prices_at > max_age:
+            return None
+        return self._mark_prices.get(perp_index)
+
+    async def batch_get_positions(self, user: str, perp_indices: Sequence[int]) -> np.ndarray:
         """
         사용자의 여러 perp 포지션을 배치로 조회
 
@@ -179,41 +758,13 @@ class HyperCoreMulticall:
             perp_indices: perp 인덱스 리스트
 
         Returns:
-            Position 리스트
+            POSITION_DTYPE structured array (조회 성공한 perp만)
         """
-        user_addr = Web3.to_checksum_address(user)
-        calls = [
-            self._encode_call(
-                PRECOMPILES["position"],
-                encode(["address", "uint16"], [user_addr, idx])
-            )
-            for idx in perp_indices
-        ]
-
-        results = self.multicall.functions.aggregate3(calls).call()
-        positions = []
+        user_addr = _checksum(user)
+        results = await self._raw_multicall(self._position_calls(user_addr, perp_indices))
+        return self._parse_positions(perp_indices, results)
 
-        for i, (success, return_data) in enumerate(results):
-            if success and len(return_data) >= 32:
-                try:
-                    szi, entry_ntl, isolated_raw_usd, leverage, is_isolated = decode(
-                        ["int64", "uint64", "int64", "uint32", "bool"],
-                        return_data
-                    )
-                    positions.append(Position(
-                        perp_index=perp_indices[i],
-                        szi=szi,
-                        entry_ntl=entry_ntl,
-                        isolated_raw_usd=isolated_raw_usd,
-                        leverage=leverage,
-                        is_isolated=is_isolated
-                    ))
-                except Exception:
-                    pass
-
-        return positions
-
-    def get_all_positions(self, user: str) -> List[Position]:
+    async def get_all_positions(self, user: str) -> np.ndarray:
         """
         사용자의 전체 포지션 조회 (225개 perp)
 
@@ -221,21 +772,18 @@ class HyperCoreMulticall:
             user: 사용자 주소
 
         Returns:
-            Position 리스트
+            POSITION_DTYPE structured array
         """
-        total_perps = 225
-        batch_size = 200
-        all_indices = list(range(total_perps))
-        chunks = chunk_list(all_indices, batch_size)
-
-        all_positions = []
-        for chunk in chunks:
-            positions = self.batch_get_positions(user, chunk)
-            all_positions.extend(positions)
+        chunk_positions = await asyncio.gather(
+            *(
+                self.batch_get_positions(user, chunk)
+                for chunk in _chunks(TOTAL_PERPS, self.batch_sizes["position"])
+            )
+        )
 
-        return all_positions
+        return np.concatenate(chunk_positions)
 
-    def get_non_zero_positions(self, user: str) -> List[Position]:
+    async def get_non_zero_positions(self, user: str) -> np.ndarray:
         """
         Non-zero 포지션만 필터링하여 반환
 
@@ -243,12 +791,12 @@ class HyperCoreMulticall:
             user: 사용자 주소
 
         Returns:
-            Non-zero Position 리스트
+            szi != 0 인 행만 담은 POSITION_DTYPE structured array
         """
-        all_positions = self.get_all_positions(user)
-        return [p for p in all_positions if p.szi != 0]
+        all_positions = await self.get_all_positions(user)
+        return all_positions[all_positions["szi"] != 0]
 
-    def batch_get_spot_balances(self, user: str, token_indices: List[int]) -> List[SpotBalance]:
+    async def batch_get_spot_balances(self, user: str, token_indices: Sequence[int]) -> np.ndarray:
         """
         사용자의 여러 토큰 잔액을 배치로 조회
 
@@ -257,74 +805,122 @@ class HyperCoreMulticall:
             token_indices: 토큰 인덱스 리스트
 
         Returns:
-            SpotBalance 리스트
+            SPOT_BALANCE_DTYPE structured array (조회 성공한 토큰만)
+        """
+        user_addr = _checksum(user)
+        results = await self._raw_multicall(self._spot_balance_calls(user_addr, token_indices))
+        return self._parse_spot_balances(token_indices, results)
+
+    async def get_all_spot_balances(self, user: str) -> np.ndarray:
+        """
+        사용자의 전체 토큰 잔액 조회 (425개 토큰)
+
+        Args:
+            user: 사용자 주소
+
+        Returns:
+            SPOT_BALANCE_DTYPE structured array
         """
-        user_addr = Web3.to_checksum_address(user)
-        calls = [
-            self._encode_call(
-                PRECOMPILES["spotBalance"],
-                encode(["address", "uint64"], [user_addr, idx])
+        chunk_balances = await asyncio.gather(
+            *(
+                self.batch_get_spot_balances(user, chunk)
+                for chunk in _chunks(TOTAL_TOKENS, self.batch_sizes["spotBalance"])
             )
-            for idx in token_indices
-        ]
+        )
 
-        results = self.multicall.functions.aggregate3(calls).call()
-        balances = []
+        return np.concatenate(chunk_balances)
 
-        for i, (success, return_data) in enumerate(results):
-            if success and len(return_data) >= 24:
-                try:
-                    total, hold, entry_ntl = decode(
-                        ["uint64", "uint64", "uint64"],
-                        return_data
-                    )
-                    balances.append(SpotBalance(
-                        token_index=token_indices[i],
-                        total=total,
-                        hold=hold,
-                        entry_ntl=entry_ntl
-                    ))
-                except Exception:
-                    pass
-
-        return balances
-
-    def get_all_spot_balances(self, user: str) -> List[SpotBalance]:
+    async def get_non_zero_balances(self, user: str) -> np.ndarray:
         """
-        사용자의 전체 토큰 잔액 조회 (425개 토큰)
+        Non-zero 잔액만 필터링하여 반환
+
+        Args:
+            user: 사용자 주소
+
+        Returns:
+            total != 0 인 행만 담은 SPOT_BALANCE_DTYPE structured array
+        """
+        all_balances = await self.get_all_spot_balances(user)
+        return all_balances[all_balances["total"] != 0]
+
+    async def snapshot(self, user: str) -> Dict[str, Any]:
+        """
+        전체 마크 가격 + 사용자 포지션 + 스팟 잔액을 eth_call 한 번으로 조회
+        (reader 설정 시 HyperCoreReader, 아니면 aggregate3 하나로 묶어 호출)
 
         Args:
             user: 사용자 주소
 
         Returns:
-            SpotBalance 리스트
+            {"mark_prices": {perp_index: mark_price},
+             "positions": POSITION_DTYPE array, "balances": SPOT_BALANCE_DTYPE array}
         """
-        total_tokens = 425
-        batch_size = 300
-        all_indices = list(range(total_tokens))
-        chunks = chunk_list(all_indices, batch_size)
+        user_addr = _checksum(user)
+        if self._reader_address:
+            return await self._read_user_snapshot(user_addr)
+
+        perp_indices = range(TOTAL_PERPS)
+        token_indices = range(TOTAL_TOKENS)
+        payload = _encode_snapshot_aggregate3(user_addr)
 
-        all_balances = []
-        for chunk in chunks:
-            balances = self.batch_get_spot_balances(user, chunk)
-            all_balances.extend(balances)
+        if len(payload) > MAX_SNAPSHOT_CALLDATA:
+            mark_prices, positions, balances = await self.snapshot_parallel(user)
+            return {"mark_prices": mark_prices, "positions": positions, "balances": balances}
 
-        return all_balances
+        results = await self._send_aggregate3(payload)
+        mark_prices = self._parse_mark_prices(perp_indices, results[:TOTAL_PERPS])
+        _store_cached(self._mark_cache, perp_indices, mark_prices, self.mark_ttl)
 
-    def get_non_zero_balances(self, user: str) -> List[SpotBalance]:
+        return {
+            "mark_prices": mark_prices,
+            "positions": self._parse_positions(perp_indices, results[TOTAL_PERPS:2 * TOTAL_PERPS]),
+            "balances": self._parse_spot_balances(token_indices, results[2 * TOTAL_PERPS:]),
+        }
+
+    async def snapshot_parallel(self, user: str) -> Tuple[Dict[int, int], np.ndarray, np.ndarray]:
         """
-        Non-zero 잔액만 필터링하여 반환
+        get_all_mark_prices / get_all_positions / get_all_spot_balances를 동시에 실행
+
+        precompile별 multicall을 그대로 쓰면서 (마크 가격 TTL 캐시 적용) 대기 시간은 가장 느린 조회 하나로 줄임
 
         Args:
             user: 사용자 주소
 
         Returns:
-            Non-zero SpotBalance 리스트
+            (mark_prices, positions, balances)
         """
-        all_balances = self.get_all_spot_balances(user)
-        return [b for b in all_balances if b.total != 0]
+        mark_prices, positions, balances = await asyncio.gather(
+            self.get_all_mark_prices(),
+            self.get_all_positions(user),
+            self.get_all_spot_balances(user),
+        )
+        return mark_prices, positions, balances
+
+    async def _read_user_snapshot(self, user_addr: str) -> Dict[str, Any]:
+        """HyperCoreReader.readUserSnapshot 한 번 호출 후 packed blob을 고정 stride로 파싱"""
+        raw = bytes(await self._eth_call(
+            self._reader_address, _encode_reader_snapshot(user_addr), self._reader_override
+        ))
+        blob_start = _ABI_UINT(raw, 0)[0] + 32
+        blob = raw[blob_start:blob_start + _ABI_UINT(raw, blob_start - 32)[0]]
+
+        marks = np.frombuffer(blob, _READER_MARK_PX_DTYPE, TOTAL_PERPS)
+        positions = np.frombuffer(blob, _READER_POSITION_DTYPE, TOTAL_PERPS, marks.nbytes)
+        balances = np.frombuffer(
+            blob, _READER_SPOT_BALANCE_DTYPE, TOTAL_TOKENS, marks.nbytes + positions.nbytes
+        )
+
+        ok = marks["ok"]
+        mark_prices = dict(zip(np.flatnonzero(ok).tolist(), marks["mark_px"][ok].tolist()))
+        _store_cached(self._mark_cache, range(TOTAL_PERPS), mark_prices, self.mark_ttl)
 
-    def batch_get_perp_asset_info(self, perp_indices: List[int]) -> List[PerpAssetInfo]:
+        return {
+            "mark_prices": mark_prices,
+            "positions": _from_reader_rows(positions, POSITION_DTYPE),
+            "balances": _from_reader_rows(balances, SPOT_BALANCE_DTYPE),
+        }
+
+    async def batch_get_perp_asset_info(self, perp_indices: Sequence[int]) -> List[PerpAssetInfo]:
         """
         perpAssetInfo 배치 조회
 
@@ -334,65 +930,172 @@ class HyperCoreMulticall:
         Returns:
             PerpAssetInfo 리스트
         """
-        calls = [
-            self._encode_call(
-                PRECOMPILES["perpAssetInfo"],
-                encode(["uint32"], [idx])
+        infos, missing = _split_cached(self._info_cache, perp_indices)
+
+        if missing:
+            chunks = [
+                missing[r.start:r.stop]
+                for r in _chunks(len(missing), self.batch_sizes["perpAssetInfo"])
+            ]
+            chunk_results = await asyncio.gather(
+                *(
+                    self._send_aggregate3(_encode_uint32_aggregate3("perpAssetInfo", chunk))
+                    for chunk in chunks
+                )
             )
-            for idx in perp_indices
-        ]
+            fetched = {}
+
+            for chunk, results in zip(chunks, chunk_results):
+                for i, (success, return_data) in enumerate(results):
+                    if not success:
+                        continue
+                    info = self._parse_perp_asset_info(return_data, chunk[i])
+                    if info:
+                        fetched[chunk[i]] = info
+                    else:
+                        logger.warning(
+                            "perpAssetInfo %d: malformed return data (%d bytes)", chunk[i], len(return_data)
+                        )
+
+            _store_cached(self._info_cache, missing, fetched, self.info_ttl)
+            infos.update(fetched)
+
+        return [infos[idx] for idx in perp_indices if idx in infos]
+
+    def _parse_perp_asset_info(self, data: bytes, index: int) -> Optional[PerpAssetInfo]:
+        """
+        perpAssetInfo raw 데이터 파싱 (hex 변환 없이 bytes에서 직접 읽음)
 
-        results = self.multicall.functions.aggregate3(calls).call()
-        infos = []
+        예외 대신 길이 / offset 범위를 검사해 잘못된 데이터면 None 반환
+        """
+        if len(data) < PERP_ASSET_INFO_MIN_SIZE:
+            return None
 
-        for i, (success, return_data) in enumerate(results):
-            if success and len(return_data) > 0:
-                info = self._parse_perp_asset_info(return_data.hex(), perp_indices[i])
-                if info:
-                    infos.append(info)
+        def read_uint(word_index: int) -> int:
+            start = word_index * 32
+            return int.from_bytes(data[start:start + 32], "big")
+
+        tuple_offset = read_uint(0) // 32
+        string_offset = read_uint(tuple_offset)
+        margin_table_id = read_uint(tuple_offset + 1)
+        sz_decimals = read_uint(tuple_offset + 2)
+        max_leverage = read_uint(tuple_offset + 3)
+        only_isolated = read_uint(tuple_offset + 4) != 0
+
+        # 문자열 파싱
+        string_start = tuple_offset + string_offset // 32
+        string_length = read_uint(string_start)
+        string_data_start = (string_start + 1) * 32
+        if string_data_start + string_length > len(data):
+            return None
+
+        coin = (
+            data[string_data_start:string_data_start + string_length]
+            .replace(b"\x00", b"")
+            .decode("latin-1")
+        )
 
-        return infos
+        return PerpAssetInfo(
+            index=index,
+            coin=coin,
+            margin_table_id=margin_table_id,
+            sz_decimals=sz_decimals,
+            max_leverage=max_leverage,
+            only_isolated=only_isolated
+        )
+
+
+T = TypeVar("T")
+
+
+class HyperCoreMulticall:
+    """
+    AsyncHyperCoreMulticall의 동기 facade (기존 동기 호출부 호환용)
 
-    def _parse_perp_asset_info(self, hex_data: str, index: int) -> Optional[PerpAssetInfo]:
-        """perpAssetInfo raw 데이터 파싱"""
+    전용 이벤트 루프 하나를 재사용해 호출 간에도 HTTP keep-alive 세션을 유지
+    루프와 aiohttp 세션을 소유하므로 with 블록으로 쓰거나 끝나면 close() 호출
+
+        with HyperCoreMulticall() as multicall:
+            prices = multicall.get_all_mark_prices()
+
+    ⚠️ 내부에서 run_until_complete를 쓰므로 이미 이벤트 루프가 돌고 있는 곳
+    (Jupyter, async 애플리케이션)에서는 호출 시 RuntimeError - AsyncHyperCoreMulticall을 직접 await
+    """
+
+    def __init__(
+        self,
+        rpc_url: str = RPC_URL,
+        mark_ttl: float = MARK_PRICE_TTL,
+        info_ttl: float = PERP_ASSET_INFO_TTL,
+        fast: bool = True,
+        rps: Optional[float] = REQUESTS_PER_SECOND,
+        batch_sizes: Optional[Dict[str, int]] = None,
+        multicall3_code: Optional[bytes] = None,
+        reader_code: Optional[bytes] = None,
+        reader_address: Optional[str] = None,
+    ):
+        self.client = AsyncHyperCoreMulticall(
+            rpc_url, mark_ttl, info_ttl, fast, rps, batch_sizes, multicall3_code,
+            reader_code, reader_address,
+        )
+        self._loop = asyncio.new_event_loop()
+
+    def _run(self, coro: Awaitable[T]) -> T:
         try:
-            if not hex_data.startswith("0x"):
-                hex_data = "0x" + hex_data
-
-            def read_uint(word_index: int) -> int:
-                start = 2 + word_index * 64
-                slice_data = hex_data[start:start + 64]
-                return int(slice_data, 16)
-
-            tuple_offset = read_uint(0) // 32
-            string_offset = read_uint(tuple_offset)
-            margin_table_id = read_uint(tuple_offset + 1)
-            sz_decimals = read_uint(tuple_offset + 2)
-            max_leverage = read_uint(tuple_offset + 3)
-            only_isolated = read_uint(tuple_offset + 4) != 0
-
-            # 문자열 파싱
-            string_start = tuple_offset + string_offset // 32
-            string_length = read_uint(string_start)
-            string_data_start = 2 + (string_start + 1) * 64
-            string_hex = hex_data[string_data_start:string_data_start + string_length * 2]
-
-            coin = ""
-            for j in range(0, len(string_hex), 2):
-                char_code = int(string_hex[j:j + 2], 16)
-                if char_code > 0:
-                    coin += chr(char_code)
-
-            return PerpAssetInfo(
-                index=index,
-                coin=coin,
-                margin_table_id=margin_table_id,
-                sz_decimals=sz_decimals,
-                max_leverage=max_leverage,
-                only_isolated=only_isolated
-            )
-        except Exception:
-            return None
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return self._loop.run_until_complete(coro)
+        coro.close()
+        raise RuntimeError(
+            "HyperCoreMulticall cannot run inside a running event loop; "
+            "await AsyncHyperCoreMulticall instead"
+        )
+
+    def close(self) -> None:
+        """HTTP 세션과 이벤트 루프 정리 (여러 번 호출해도 안전)"""
+        if self._loop.is_closed():
+            return
+        self._run(self.client.w3.provider.disconnect())
+        self._loop.close()
+
+    def __enter__(self) -> "HyperCoreMulticall":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def batch_get_mark_prices(self, perp_indices: Sequence[int]) -> Dict[int, int]:
+        return self._run(self.client.batch_get_mark_prices(perp_indices))
+
+    def get_all_mark_prices(self) -> Dict[int, int]:
+        return self._run(self.client.get_all_mark_prices())
+
+    def batch_get_positions(self, user: str, perp_indices: Sequence[int]) -> np.ndarray:
+        return self._run(self.client.batch_get_positions(user, perp_indices))
+
+    def get_all_positions(self, user: str) -> np.ndarray:
+        return self._run(self.client.get_all_positions(user))
+
+    def get_non_zero_positions(self, user: str) -> np.ndarray:
+        return self._run(self.client.get_non_zero_positions(user))
+
+    def batch_get_spot_balances(self, user: str, token_indices: Sequence[int]) -> np.ndarray:
+        return self._run(self.client.batch_get_spot_balances(user, token_indices))
+
+    def get_all_spot_balances(self, user: str) -> np.ndarray:
+        return self._run(self.client.get_all_spot_balances(user))
+
+    def get_non_zero_balances(self, user: str) -> np.ndarray:
+        return self._run(self.client.get_non_zero_balances(user))
+
+    def snapshot(self, user: str) -> Dict[str, Any]:
+        return self._run(self.client.snapshot(user))
+
+    def snapshot_parallel(self, user: str) -> Tuple[Dict[int, int], np.ndarray, np.ndarray]:
+        return self._run(self.client.snapshot_parallel(user))
+
+    def batch_get_perp_asset_info(self, perp_indices: Sequence[int]) -> List[PerpAssetInfo]:
+        return self._run(self.client.batch_get_perp_asset_info(perp_indices))
 
 
 def main():
@@ -424,15 +1127,15 @@ def main():
     positions = multicall.get_non_zero_positions(test_user)
     print(f"   Non-zero 포지션: {len(positions)}개")
     for p in positions:
-        direction = "Long" if p.is_long else "Short"
-        print(f"   - Perp {p.perp_index}: szi={p.szi} ({direction}), leverage={p.leverage}x")
+        direction = "Long" if p["szi"] > 0 else "Short"
+        print(f"   - Perp {p['perp_index']}: szi={p['szi']} ({direction}), leverage={p['leverage']}x")
 
     # 4. 사용자 잔액 조회
     print(f"\n4. 사용자 Non-zero 잔액 조회")
     balances = multicall.get_non_zero_balances(test_user)
     print(f"   Non-zero 잔액: {len(balances)}개")
     for b in balances:
-        print(f"   - Token {b.token_index}: total={b.total}")
+        print(f"   - Token {b['token_index']}: total={b['total']}")
 
     # 5. perpAssetInfo 배치 조회
     print("\n5. perpAssetInfo 배치 조회 (0-9)")
@@ -440,6 +1143,18 @@ def main():
     for info in perp_infos:
         print(f"   {info.index}: {info.coin} (szDec={info.sz_decimals}, maxLev={info.max_leverage}x)")
 
+    # 6. 마크 가격 + 포지션 + 잔액 스냅샷 (aggregate3 1회)
+    print("\n6. 사용자 스냅샷 조회 (마크 가격 + 포지션 + 잔액, 1 RTT)")
+    start_time = time.time()
+    snap = multicall.snapshot(test_user)
+    elapsed = (time.time() - start_time) * 1000
+    print(
+        f"   가격 {len(snap['mark_prices'])}개, 포지션 {len(snap['positions'])}개, "
+        f"잔액 {len(snap['balances'])}개, {elapsed:.0f}ms"
+    )
+
+    multicall.close()
+
 
 if __name__ == "__main__":
     main()
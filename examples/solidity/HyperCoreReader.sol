@@ -0,0 +1,119 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.20;
+
+/**
+ * @title HyperCoreReader
+ * @notice 마크 가격 / 포지션 / 스팟 잔액 precompile을 한 번의 EVM 실행으로 읽는 fused reader
+ * @dev Multicall3 aggregate3와 달리 결과를 (bool,bytes)[] 대신 고정 stride의 packed bytes로 반환
+ *      배포 없이 eth_call state override로 임의 주소에 코드를 올려 사용하는 것을 전제로 함
+ *
+ * 반환 blob 레이아웃 (big-endian, 패딩 없음):
+ *   [perps.length  x  9 bytes] ok(1) markPx(8)
+ *   [perps.length  x 30 bytes] ok(1) szi(8) entryNtl(8) isolatedRawUsd(8) leverage(4) isIsolated(1)
+ *   [tokens.length x 25 bytes] ok(1) total(8) hold(8) entryNtl(8)
+ *
+ * ok = 0 이면 precompile 호출 실패 (나머지 필드는 0)
+ */
+contract HyperCoreReader {
+    address constant POSITION = 0x0000000000000000000000000000000000000800;
+    address constant SPOT_BALANCE = 0x0000000000000000000000000000000000000801;
+    address constant MARK_PX = 0x0000000000000000000000000000000000000806;
+
+    uint256 constant MARK_PX_STRIDE = 9;
+    uint256 constant POSITION_STRIDE = 30;
+    uint256 constant SPOT_BALANCE_STRIDE = 25;
+
+    /**
+     * @notice 사용자 스냅샷 (마크 가격 + 포지션 + 스팟 잔액) 조회
+     * @param user 사용자 주소
+     * @param perps 조회할 perp 인덱스 배열 (마크 가격, 포지션 공통)
+     * @param tokens 조회할 토큰 인덱스 배열
+     * @return out 고정 stride packed blob (컨트랙트 설명 참고)
+     */
+    function readUserSnapshot(address user, uint32[] calldata perps, uint64[] calldata tokens)
+        external view returns (bytes memory out)
+    {
+        uint256 size = perps.length * (MARK_PX_STRIDE + POSITION_STRIDE)
+            + tokens.length * SPOT_BALANCE_STRIDE;
+
+        // 필드를 32-byte mstore로 이어 쓰므로 마지막 레코드 뒤에 32 bytes 여유 확보
+        out = new bytes(size + 32);
+        uint256 ptr;
+        assembly {
+            ptr := add(out, 0x20)
+        }
+
+        for (uint256 i = 0; i < perps.length; i++) {
+            ptr = _readMarkPx(ptr, perps[i]);
+        }
+        for (uint256 i = 0; i < perps.length; i++) {
+            ptr = _readPosition(ptr, user, perps[i]);
+        }
+        for (uint256 i = 0; i < tokens.length; i++) {
+            ptr = _readSpotBalance(ptr, user, tokens[i]);
+        }
+
+        assembly {
+            mstore(out, size)
+        }
+    }
+
+    function _readMarkPx(uint256 ptr, uint32 index) private view returns (uint256) {
+        assembly {
+            mstore(0x00, and(index, 0xffffffff))
+            let ok := and(staticcall(gas(), MARK_PX, 0x00, 0x20, 0x00, 0x20), eq(returndatasize(), 0x20))
+
+            mstore8(ptr, ok)
+            mstore(add(ptr, 1), shl(192, mul(ok, mload(0x00))))
+        }
+        return ptr + MARK_PX_STRIDE;
+    }
+
+    function _readPosition(uint256 ptr, address user, uint32 index) private view returns (uint256) {
+        assembly {
+            let m := mload(0x40)
+            mstore(m, and(user, 0xffffffffffffffffffffffffffffffffffffffff))
+            mstore(add(m, 0x20), and(index, 0xffff))
+            let ok := and(staticcall(gas(), POSITION, m, 0x40, m, 0xa0), eq(returndatasize(), 0xa0))
+            if iszero(ok) {
+                calldatacopy(m, calldatasize(), 0xa0)
+            }
+
+            mstore8(ptr, ok)
+            mstore(add(ptr, 1), shl(192, mload(m)))               // szi (int64, 하위 8 bytes)
+            mstore(add(ptr, 9), shl(192, mload(add(m, 0x20))))    // entryNtl
+            mstore(add(ptr, 17), shl(192, mload(add(m, 0x40))))   // isolatedRawUsd (int64)
+            mstore(add(ptr, 25), shl(224, mload(add(m, 0x60))))   // leverage (uint32)
+            mstore8(add(ptr, 29), mload(add(m, 0x80)))            // isIsolated
+        }
+        return ptr + POSITION_STRIDE;
+    }
+
+    function _readSpotBalance(uint256 ptr, address user, uint64 index) private view returns (uint256) {
+        assembly {
+            let m := mload(0x40)
+            mstore(m, and(user, 0xffffffffffffffffffffffffffffffffffffffff))
+            mstore(add(m, 0x20), and(index, 0xffffffffffffffff))
+            let ok := and(staticcall(gas(), SPOT_BALANCE, m, 0x40, m, 0x60), eq(returndatasize(), 0x60))
+            if iszero(ok) {
+                calldatacopy(m, calldatasize(), 0x60)
+            }
+
+            mstore8(ptr, ok)
+            mstore(add(ptr, 1), shl(192, mload(m)))               // total
+            mstore(add(ptr, 9), shl(192, mload(add(m, 0x20))))    // hold
+            mstore(add(ptr, 17), shl(192, mload(add(m, 0x40))))   // entryNtl
+        }
+        return ptr + SPOT_BALANCE_STRIDE;
+    }
+}
+
+/**
+ * 사용 예제 (eth_call state override, 배포 불필요):
+ *
+ * // 1. 컴파일한 HyperCoreReader 런타임 바이트코드를 임의 주소에 override
+ * // 2. readUserSnapshot(user, [0..224], [0..424]) 을 그 주소로 eth_call
+ * // 3. 반환 bytes를 위 레이아웃대로 고정 stride로 잘라 파싱
+ *
+ * Python: examples/python/multicall_example.py 의 HyperCoreMulticall(reader_code=...).snapshot(user)
+ */